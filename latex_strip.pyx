@@ -0,0 +1,247 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C fast path for strip_latex_to_plain.
+
+Single DFA-style pass over the raw UTF-8 bytes, mirroring the pure-Python
+scanner in latex_utils._strip_latex_scan: comment lines, \item, \cmd{arg},
+bare \cmd, blank-line runs and space/tab runs are handled in one walk,
+emitting into a preallocated buffer (output is never longer than input).
+
+Build with `python setup.py build_ext --inplace`; latex_utils falls back
+to the pure-Python scanner when this module is absent.
+"""
+
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memchr
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+
+cdef inline bint _is_alpha(unsigned char c):
+    return (c'a' <= c <= c'z') or (c'A' <= c <= c'Z')
+
+
+cdef inline bint _is_space(unsigned char c):
+    # ASCII \s: space, tab, newline, carriage return, form feed, vertical tab
+    return (
+        c == c' ' or c == c'\t' or c == c'\n'
+        or c == c'\r' or c == 0x0C or c == 0x0B
+    )
+
+
+# Pending-whitespace ranks, merged greedily like the Python scanner:
+# 0 = none, 1 = single space, 2 = single newline, 3 = blank line.
+cdef inline Py_ssize_t _flush(char *dst, Py_ssize_t di, int *pending, bint emitted):
+    if emitted and pending[0]:
+        if pending[0] == 1:
+            dst[di] = c' '
+            di += 1
+        elif pending[0] == 2:
+            dst[di] = c'\n'
+            di += 1
+        else:
+            dst[di] = c'\n'
+            di += 1
+            dst[di] = c'\n'
+            di += 1
+    pending[0] = 0
+    return di
+
+
+cdef Py_ssize_t _scan(
+    const unsigned char *s,
+    Py_ssize_t n,
+    char *dst,
+    Py_ssize_t di,
+    bint rescan,
+):
+    """
+    Core scanner: strip s[0:n] into dst starting at di, return the new di.
+
+    When rescan is true, a kept \\cmd{arg} whose content still holds
+    markup or newlines is scanned once more (with rescan off, so never
+    deeper), mirroring _strip_latex_scan's one-level nesting rule.
+    """
+    cdef Py_ssize_t i = 0, j, k, m, arg_start, arg_end, last_nl, nl_count
+    cdef Py_ssize_t save_di, sub_start
+    cdef int pending = 0
+    cdef int save_pending
+    cdef bint emitted = False
+    cdef bint line_start, has_arg
+    cdef unsigned char c
+
+    while i < n:
+        line_start = i == 0 or s[i - 1] == c'\n'
+        c = s[i]
+
+        # Comment line: ^[ \t]*% ... through the trailing newline.
+        if line_start and (c == c'%' or c == c' ' or c == c'\t'):
+            j = i
+            while j < n and (s[j] == c' ' or s[j] == c'\t'):
+                j += 1
+            if j < n and s[j] == c'%':
+                while j < n and s[j] != c'\n':
+                    j += 1
+                if j < n:
+                    j += 1
+                i = j
+                continue
+
+        if c == c'\\':
+            j = i + 1
+            # \item (prefix match, like the regex) -> "- ", eat whitespace
+            if (
+                j + 3 < n
+                and s[j] == c'i' and s[j + 1] == c't'
+                and s[j + 2] == c'e' and s[j + 3] == c'm'
+            ):
+                k = j + 4
+                while k < n and _is_space(s[k]):
+                    k += 1
+                di = _flush(dst, di, &pending, emitted)
+                dst[di] = c'-'
+                dst[di + 1] = c' '
+                di += 2
+                emitted = True
+                i = k
+                continue
+
+            k = j
+            while k < n and _is_alpha(s[k]):
+                k += 1
+            if k == j:
+                # Lone backslash (e.g. \\): literal, like the regex
+                di = _flush(dst, di, &pending, emitted)
+                dst[di] = c'\\'
+                di += 1
+                emitted = True
+                i += 1
+                continue
+            if k < n and s[k] == c'*':
+                k += 1
+
+            # \cmd[opt]{arg} keeps arg; anything short of the full
+            # bracket+brace form falls back to a bare \cmd drop.
+            m = k
+            has_arg = False
+            if m < n and s[m] == c'[':
+                m += 1
+                while m < n and s[m] != c']':
+                    m += 1
+                if m < n:
+                    m += 1
+                else:
+                    m = k  # unclosed [: bare command
+            if m < n and s[m] == c'{':
+                arg_start = m + 1
+                arg_end = arg_start
+                while arg_end < n and s[arg_end] != c'}':
+                    arg_end += 1
+                if arg_end < n:
+                    has_arg = True
+            if has_arg:
+                if arg_end > arg_start:
+                    if rescan and (
+                        memchr(s + arg_start, c'\\', arg_end - arg_start) != NULL
+                        or memchr(s + arg_start, c'\n', arg_end - arg_start) != NULL
+                    ):
+                        # One level of nesting: scan the kept content
+                        # in place, rolling back the flushed pending
+                        # whitespace if it produced nothing.
+                        save_di = di
+                        save_pending = pending
+                        di = _flush(dst, di, &pending, emitted)
+                        sub_start = di
+                        di = _scan(s + arg_start, arg_end - arg_start, dst, di, False)
+                        if di > sub_start:
+                            emitted = True
+                        else:
+                            di = save_di
+                            pending = save_pending
+                    else:
+                        di = _flush(dst, di, &pending, emitted)
+                        memcpy(dst + di, s + arg_start, arg_end - arg_start)
+                        di += arg_end - arg_start
+                        emitted = True
+                i = arg_end + 1
+            else:
+                i = k
+            continue
+
+        if c == c'\n':
+            # \n\s*\n+ is a blank run ending at its last newline;
+            # a lone newline just raises the pending rank.
+            j = i + 1
+            last_nl = i
+            nl_count = 1
+            while j < n and _is_space(s[j]):
+                if s[j] == c'\n':
+                    last_nl = j
+                    nl_count += 1
+                j += 1
+            if nl_count >= 2:
+                if pending < 3:
+                    pending = 3
+                i = last_nl + 1
+                continue
+            # Lone newline: raises the pending rank when another token
+            # (markup, whitespace, comment, EOF) follows, but stays
+            # solid before literal text, mirroring how the Python
+            # scanner only folds a literal segment's trailing newline.
+            j = i + 1
+            if (
+                j >= n
+                or s[j] == c'\n' or s[j] == c' ' or s[j] == c'\t'
+                or s[j] == c'%'
+                or (s[j] == c'\\' and j + 1 < n and _is_alpha(s[j + 1]))
+            ):
+                if pending < 2:
+                    pending = 2
+            elif pending < 2:
+                di = _flush(dst, di, &pending, emitted)
+                dst[di] = c'\n'
+                di += 1
+                emitted = True
+            # else: pending already holds a newline and absorbs this
+            # one, capping output at two consecutive newlines
+            i += 1
+            continue
+
+        if c == c' ' or c == c'\t':
+            while i < n and (s[i] == c' ' or s[i] == c'\t'):
+                i += 1
+            if pending < 1:
+                pending = 1
+            continue
+
+        # Literal byte (multi-byte UTF-8 sequences pass through here).
+        di = _flush(dst, di, &pending, emitted)
+        dst[di] = c
+        di += 1
+        emitted = True
+        i += 1
+
+    return di
+
+
+def latex_strip_fast(bytes src not None) -> bytes:
+    """
+    Strip LaTeX markup from UTF-8 bytes; bytes in, cleaned bytes out.
+    The caller decodes and strips leading/trailing whitespace.
+    """
+    cdef const unsigned char *s = src
+    cdef Py_ssize_t n = len(src)
+    cdef Py_ssize_t di
+    cdef char *dst
+
+    if n == 0:
+        return b""
+
+    dst = <char *> malloc(n)
+    if dst == NULL:
+        raise MemoryError()
+
+    try:
+        di = _scan(s, n, dst, 0, True)
+        return PyBytes_FromStringAndSize(dst, di)
+    finally:
+        free(dst)
@@ -1,6 +1,63 @@
+import functools
+import mmap
 import re
+from pathlib import Path
 from typing import Optional
 
+# Files above this size are scanned via mmap instead of being decoded to a
+# Python str up front; only the matched section body gets decoded.
+_MMAP_THRESHOLD = 256 * 1024
+
+try:
+    # Optional C fast path for strip_latex_to_plain (see setup.py); the
+    # pure-Python scanner below is used when it has not been built.
+    from latex_strip import latex_strip_fast as _latex_strip_fast
+except ImportError:
+    _latex_strip_fast = None
+
+# Precompiled patterns: compiling once at import time keeps the hot
+# per-line/per-call paths free of re-cache lookups. LaTeX command names
+# are ASCII by definition, so command patterns carry re.ASCII and get the
+# cheap ASCII tables for \b/\s/\w instead of the Unicode property tables.
+_SECTION_CMD_RE = re.compile(r"\\([a-zA-Z]+)\*?\{([^}]*)\}", re.ASCII)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# One combined alternation for strip_latex_to_plain: comment lines, \item,
+# \cmd{arg}, bare \cmd, blank-line runs, and space/tab runs, matched in a
+# single scan instead of one substitution pass each.
+_STRIP_SCAN_RE = re.compile(
+    r"(?P<comment>^[ \t]*%[^\n]*\n?)"
+    r"|(?P<item>\\item\s*)"
+    r"|\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{(?P<arg>[^}]*)\}"
+    r"|(?P<cmd>\\[a-zA-Z]+\*?)"
+    r"|(?P<blank>\n\s*\n+)"
+    r"|(?P<ws>[ \t]+)",
+    re.MULTILINE | re.ASCII,
+)
+
+# Priority for merging adjacent whitespace during the scan.
+_WS_RANK = {"": 0, " ": 1, "\n": 2, "\n\n": 3}
+
+# Normalization rules for tool-supplied LaTeX, kept as one compiled
+# pattern so additional rules (stray \r, double-escaped quotes, ...) can
+# be folded into the alternation without adding passes over the buffer.
+_NORMALIZE_RE = re.compile(r"\\n")
+
+# Line prefixes skipped wholesale by latex_preview; a tuple argument lets
+# str.startswith test all of them in one C-level call.
+_PREVIEW_SKIP_PREFIXES = (
+    "%",
+    "\\documentclass",
+    "\\usepackage",
+    "\\begin{document}",
+    "\\end{document}",
+)
+
+# Commands treated as section-like headings in previews.
+_SECTION_CMDS = frozenset(
+    ["section", "subsection", "subsubsection", "cvsection", "chapter", "sect"]
+)
+
 
 def normalize_latex_content(s: str) -> str:
     """
@@ -9,7 +66,7 @@ def normalize_latex_content(s: str) -> str:
     Example:
         '...May 2026\\\\nMaster...' -> '...May 2026\\\\\\nMaster...'
     """
-    return s.replace("\\n", "\\\n")
+    return _NORMALIZE_RE.sub("\\\\\n", s)
 
 
 def latex_preview(text: str) -> str:
@@ -23,24 +80,16 @@ def latex_preview(text: str) -> str:
     lines = text.splitlines()
     out: list[str] = []
 
-    section_cmds = ["section", "subsection", "subsubsection", "cvsection", "chapter", "sect"]
-
     for line in lines:
         stripped = line.strip()
         if not stripped:
             continue
-        if stripped.startswith("%"):
-            continue
-        if stripped.startswith("\\documentclass"):
-            continue
-        if stripped.startswith("\\usepackage"):
-            continue
-        if stripped.startswith("\\begin{document}") or stripped.startswith("\\end{document}"):
+        if stripped.startswith(_PREVIEW_SKIP_PREFIXES):
             continue
 
         # Section-like commands: \section{Title}, \sect{Title}, etc.
-        m = re.match(r"\\([a-zA-Z]+)\*?\{([^}]*)\}", stripped)
-        if m and m.group(1) in section_cmds:
+        m = _SECTION_CMD_RE.match(stripped)
+        if m and m.group(1) in _SECTION_CMDS:
             title = m.group(2).strip()
             out.append("")
             out.append(title.upper())
@@ -59,6 +108,75 @@ def latex_preview(text: str) -> str:
     return "\n".join(out).strip()
 
 
+@functools.lru_cache(maxsize=256)
+def _section_header_regex(heading_command: str, section_title: str) -> re.Pattern:
+    """
+    Pattern matching a section header: \\cmd{Title} or \\cmd*{Title}, plus
+    trailing whitespace.
+
+    Cached so repeated tool calls against the same section reuse the
+    compiled pattern instead of rebuilding it. Safe to key on the raw
+    strings because re.escape is deterministic.
+    """
+    heading_cmd_escaped = re.escape(heading_command)
+    title_escaped = re.escape(section_title)
+    return re.compile(rf"\\{heading_cmd_escaped}\*?\{{{title_escaped}\}}\s*", re.ASCII)
+
+
+@functools.lru_cache(maxsize=256)
+def _section_stop_regex(heading_command: str) -> re.Pattern:
+    """
+    Pattern matching the start of the next section or the document end.
+
+    Dedup the stop commands: for the common heading_command="section"
+    case the custom heading would otherwise appear twice in the
+    alternation, bloating the compiled NFA for no reason. Sorted for a
+    deterministic pattern.
+    """
+    stops = sorted({heading_command, "section", "subsection", "chapter", "cvsection"})
+    stop_alt = "|".join(rf"\\{re.escape(s)}\b" for s in stops) + r"|\\end\{document\}"
+    return re.compile(stop_alt, re.ASCII)
+
+
+@functools.lru_cache(maxsize=256)
+def _section_header_regex_bytes(heading_command: str, section_title: str) -> re.Pattern:
+    """
+    Bytes twin of _section_header_regex, for matching against mmap'd
+    files. The pattern is the UTF-8 encoding of the str pattern, so
+    literal titles match their encoded form byte-for-byte.
+    """
+    return re.compile(
+        _section_header_regex(heading_command, section_title).pattern.encode("utf-8")
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _section_stop_regex_bytes(heading_command: str) -> re.Pattern:
+    """Bytes twin of _section_stop_regex."""
+    return re.compile(_section_stop_regex(heading_command).pattern.encode("utf-8"))
+
+
+def section_body_span(
+    full_text: str,
+    section_title: str,
+    heading_command: str = "section",
+) -> Optional[tuple[int, int]]:
+    """
+    Locate a section body as (start, end) indices into full_text, or None
+    if the header is absent.
+
+    Two linear searches — header, then the next stop after it — instead of
+    the old '(.*?)(?=stops)' pattern, whose lazy dot retried every stop
+    alternative at every position (O(N*stops) backtracking). With no stop
+    after the header, the body runs to end of text.
+    """
+    m = _section_header_regex(heading_command, section_title).search(full_text)
+    if not m:
+        return None
+    stop = _section_stop_regex(heading_command).search(full_text, m.end())
+    return m.end(), stop.start() if stop else len(full_text)
+
+
 def extract_section_body(
     full_text: str,
     section_title: str,
@@ -68,27 +186,112 @@ def extract_section_body(
     Extract the body of a LaTeX section given its title and heading command.
     Returns the body text or None if not found.
     """
-    heading_cmd_escaped = re.escape(heading_command)
-    title_escaped = re.escape(section_title)
+    span = section_body_span(full_text, section_title, heading_command)
+    if span is None:
+        return None
+    return full_text[span[0]:span[1]]
 
-    pattern = (
-        rf"(\\{heading_cmd_escaped}\*?\{{{title_escaped}\}}\s*)"  # header
-        rf"(.*?)"                                                # body
-        rf"(?=("                                                 # lookahead: stop before next header/end
-        rf"\\{heading_cmd_escaped}\b|"
-        rf"\\section\b|"
-        rf"\\subsection\b|"
-        rf"\\chapter\b|"
-        rf"\\cvsection\b|"
-        rf"\\end\{{document\}}"
-        rf"))"
-    )
 
-    regex = re.compile(pattern, re.DOTALL)
-    m = regex.search(full_text)
-    if not m:
-        return None
-    return m.group(2)
+def extract_section_body_from_file(
+    file_path: Path,
+    section_title: str,
+    heading_command: str = "section",
+) -> Optional[str]:
+    """
+    extract_section_body, reading straight from disk.
+
+    Large files (theses, long papers) are scanned through mmap with the
+    bytes pattern, so the OS page cache backs the search and only the
+    matched body is ever decoded to str. Small files take the plain
+    read-and-decode path.
+    """
+    if file_path.stat().st_size <= _MMAP_THRESHOLD:
+        with open(file_path, "rb") as f:
+            text = f.read().decode("utf-8")
+        return extract_section_body(text, section_title, heading_command)
+
+    header_re = _section_header_regex_bytes(heading_command, section_title)
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            m = header_re.search(mm)
+            if not m:
+                return None
+            stop = _section_stop_regex_bytes(heading_command).search(mm, m.end())
+            end = stop.start() if stop else len(mm)
+            return mm[m.end():end].decode("utf-8")
+
+
+def _strip_latex_scan(text: str, _rescan_args: bool = True) -> str:
+    """
+    Single stateful pass over the text driving _STRIP_SCAN_RE.
+
+    Emits cleaned pieces into a list and joins once at the end, so a large
+    .tex buffer is copied once instead of once per substitution rule.
+    Whitespace around removed commands/comments is merged as we go
+    (blank-line run > newline > space) instead of in separate passes.
+
+    A kept \\cmd{arg} whose content still holds markup or newlines is
+    rescanned once (never deeper), so nested formatting like
+    \\textbf{\\emph{x}} strips to {x} as the old multi-pass pipeline did.
+    """
+    out: list[str] = []
+    pending = ""  # collapsed whitespace waiting to be emitted before solid text
+    pos = 0
+
+    def push(piece: str) -> None:
+        nonlocal pending
+        if out and pending:
+            out.append(pending)
+        pending = ""
+        out.append(piece)
+
+    def merge(ws: str) -> None:
+        nonlocal pending
+        if _WS_RANK[ws] > _WS_RANK[pending]:
+            pending = ws
+
+    def emit_segment(segment: str) -> None:
+        # A leading newline folds into pending whitespace that already
+        # holds one (left behind by removed markup), so at most two
+        # consecutive newlines ever reach the output -- the guarantee the
+        # old \n\s*\n+ -> \n\n pass gave.
+        if segment.startswith("\n") and _WS_RANK[pending] >= _WS_RANK["\n"]:
+            segment = segment[1:]
+        # A literal segment holds at most one trailing newline (longer
+        # runs match the blank group); fold it into pending whitespace.
+        solid = segment.rstrip("\n")
+        if solid:
+            push(solid)
+        if len(solid) != len(segment):
+            merge("\n")
+
+    for m in _STRIP_SCAN_RE.finditer(text):
+        if m.start() > pos:
+            emit_segment(text[pos:m.start()])
+        pos = m.end()
+
+        if m.group("item") is not None:
+            push("- ")
+        elif m.group("arg"):
+            # Keep contents of simple commands: \textbf{API} -> API
+            arg = m.group("arg")
+            if _rescan_args and ("\\" in arg or "\n" in arg):
+                # The old pipeline's later passes (bare-command removal,
+                # whitespace collapse) also ran over kept content; one
+                # non-recursive rescan reproduces that.
+                arg = _strip_latex_scan(arg, _rescan_args=False)
+            if arg:
+                push(arg)
+        elif m.group("blank") is not None:
+            merge("\n\n")
+        elif m.group("ws") is not None:
+            merge(" ")
+        # comment lines, bare commands, and empty-arg commands are dropped
+
+    if pos < len(text):
+        emit_segment(text[pos:])
+
+    return "".join(out)
 
 
 def strip_latex_to_plain(text: str) -> str:
@@ -98,25 +301,16 @@ def strip_latex_to_plain(text: str) -> str:
 
     Works for resumes, research papers, theses, etc.
     """
-    # Remove comments
-    lines = []
-    for line in text.splitlines():
-        if line.strip().startswith("%"):
-            continue
-        lines.append(line)
-    text = "\n".join(lines)
+    if _latex_strip_fast is not None:
+        return _latex_strip_fast(text.encode("utf-8")).decode("utf-8").strip()
+    return _strip_latex_scan(text).strip()
 
-    # Turn \item into bullets
-    text = re.sub(r"\\item\s*", "- ", text)
 
-    # Keep contents of simple commands: \textbf{API} -> API
-    text = re.sub(r"\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{([^}]*)\}", r"\1", text)
-
-    # Remove remaining backslash-commands without arguments: \textbf, \emph, etc.
-    text = re.sub(r"\\[a-zA-Z]+(\*?)", "", text)
-
-    # Replace multiple spaces/newlines with single spaces/newlines
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n\s*\n+", "\n\n", text)
+def split_sentences(text: str, maxsplit: int = 0) -> list[str]:
+    """
+    Very simple sentence splitting on terminal punctuation.
 
-    return text.strip()
+    maxsplit behaves like re.split's: 0 splits everywhere, N stops after
+    N splits (the last element then holds the unsplit remainder).
+    """
+    return _SENTENCE_SPLIT_RE.split(text, maxsplit=maxsplit)
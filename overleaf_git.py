@@ -1,7 +1,10 @@
+import functools
 import os
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
+from typing import Optional
 from urllib.parse import urlparse, urlunparse, quote
 
 # Overleaf configuration
@@ -9,6 +12,15 @@ OVERLEAF_GIT_URL = os.environ.get("OVERLEAF_GIT_URL")
 OVERLEAF_TOKEN = os.environ.get("OVERLEAF_TOKEN")
 OVERLEAF_EMAIL = os.environ.get("OVERLEAF_EMAIL")
 
+# Cached working tree: cloning over HTTPS dominates tool latency, so we
+# clone once per process and refresh with a fast-forward pull afterwards.
+_REPO_DIR: Optional[Path] = None
+_REPO_LOCK = threading.Lock()
+
+# Remote default branch, detected once at clone time so pushes go straight
+# to the right branch instead of trying main and falling back to master.
+_DEFAULT_BRANCH: Optional[str] = None
+
 
 def run(cmd, cwd=None):
     """
@@ -32,21 +44,21 @@ def run(cmd, cwd=None):
     return result
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_email() -> str:
     """
-    Return email to use for git commits.
+    Return email to use for git commits. Cached: the environment is
+    immutable for the process lifetime.
     """
     return OVERLEAF_EMAIL or "overleaf-mcp@example.com"
 
 
-def clone_overleaf_repo() -> Path:
+@functools.lru_cache(maxsize=1)
+def _auth_url() -> str:
     """
-    Clone the Overleaf Git repository using the Git auth token.
-
-    OVERLEAF_GIT_URL should be the plain project URL, e.g.:
-        https://git.overleaf.com/<project-id>
-
-    OVERLEAF_TOKEN is your Git authentication token from Overleaf.
+    Build the token-authenticated clone URL. Cached for the same reason as
+    get_git_email; configuration errors still surface on every call since
+    lru_cache does not cache raised exceptions.
     """
     if not OVERLEAF_GIT_URL or not OVERLEAF_TOKEN:
         raise RuntimeError(
@@ -57,13 +69,6 @@ def clone_overleaf_repo() -> Path:
     if not OVERLEAF_GIT_URL.startswith("https://"):
         raise RuntimeError("OVERLEAF_GIT_URL must start with https://")
 
-    # Create temp dir and keep a global reference so it's not cleaned up early
-    tmpdir = tempfile.TemporaryDirectory()
-    repo_dir = Path(tmpdir.name) / "project"
-    if "_TMPDIRS" not in globals():
-        globals()["_TMPDIRS"] = []
-    globals()["_TMPDIRS"].append(tmpdir)
-
     # Parse the base URL (e.g. https://git.overleaf.com/<project-id>)
     parsed = urlparse(OVERLEAF_GIT_URL)
     if not parsed.hostname:
@@ -79,9 +84,96 @@ def clone_overleaf_repo() -> Path:
     if parsed.port:
         netloc += f":{parsed.port}"
 
-    auth_url = urlunparse(parsed._replace(netloc=netloc))
+    return urlunparse(parsed._replace(netloc=netloc))
+
+
+def clone_overleaf_repo(full_history: bool = False) -> Path:
+    """
+    Return a working tree of the Overleaf Git repository.
+
+    The first call clones the project using the Git auth token; later calls
+    reuse the same checkout and just fast-forward it to the remote. If the
+    cached checkout cannot be fast-forwarded (diverged or corrupted), it is
+    thrown away and cloned fresh.
 
-    # Perform git clone
-    run(["git", "clone", auth_url, str(repo_dir)])
+    By default the clone is shallow and blobless (--depth=1 --single-branch
+    --filter=blob:none): read-only tools only need HEAD's files, and this
+    cuts bytes transferred dramatically. Pass full_history=True (used by the
+    write path) to unshallow an existing checkout, in case the remote
+    rejects pushes from a shallow clone.
 
-    return repo_dir
+    OVERLEAF_GIT_URL should be the plain project URL, e.g.:
+        https://git.overleaf.com/<project-id>
+
+    OVERLEAF_TOKEN is your Git authentication token from Overleaf.
+    """
+    global _REPO_DIR, _DEFAULT_BRANCH
+
+    auth_url = _auth_url()
+
+    with _REPO_LOCK:
+        if _REPO_DIR is not None and (_REPO_DIR / ".git").exists():
+            try:
+                if full_history and (_REPO_DIR / ".git" / "shallow").exists():
+                    run(["git", "fetch", "--unshallow"], cwd=_REPO_DIR)
+                # ff-only so local commits from a failed push are never
+                # silently clobbered.
+                run(["git", "pull", "--ff-only"], cwd=_REPO_DIR)
+                return _REPO_DIR
+            except RuntimeError:
+                # Stale or diverged checkout: fall through to a fresh clone.
+                _REPO_DIR = None
+
+        # Create temp dir and keep a global reference so it's not cleaned up early
+        tmpdir = tempfile.TemporaryDirectory()
+        repo_dir = Path(tmpdir.name) / "project"
+        if "_TMPDIRS" not in globals():
+            globals()["_TMPDIRS"] = []
+        globals()["_TMPDIRS"].append(tmpdir)
+
+        # Perform git clone; shallow + blobless unless full history is needed
+        clone_cmd = ["git", "clone"]
+        if not full_history:
+            clone_cmd += ["--depth=1", "--single-branch", "--filter=blob:none"]
+        run(clone_cmd + [auth_url, str(repo_dir)])
+
+        # Detect the remote's default branch once, e.g. "origin/master".
+        try:
+            result = run(
+                ["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
+                cwd=repo_dir,
+            )
+            _DEFAULT_BRANCH = result.stdout.strip().split("/", 1)[-1]
+        except RuntimeError:
+            # origin/HEAD may be unset on some remotes; the checked-out
+            # branch is the default by definition right after a clone.
+            result = run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir)
+            _DEFAULT_BRANCH = result.stdout.strip()
+
+        _REPO_DIR = repo_dir
+        return repo_dir
+
+
+def get_head_sha(repo_dir: Path) -> str:
+    """
+    Commit sha of the checkout's HEAD; readers use it as a cache key that
+    automatically changes whenever a pull brings in new content.
+
+    Resolved by reading .git/HEAD directly (no subprocess); falls back to
+    'git rev-parse' when the ref is packed.
+    """
+    head = (repo_dir / ".git" / "HEAD").read_text().strip()
+    if head.startswith("ref: "):
+        ref_file = repo_dir / ".git" / head[len("ref: "):]
+        if ref_file.exists():
+            return ref_file.read_text().strip()
+        return run(["git", "rev-parse", "HEAD"], cwd=repo_dir).stdout.strip()
+    return head
+
+
+def get_default_branch() -> str:
+    """
+    Name of the remote's default branch, cached at clone time.
+    Falls back to "master" (Overleaf's default) if detection failed.
+    """
+    return _DEFAULT_BRANCH or "master"
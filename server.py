@@ -1,22 +1,81 @@
+import functools
 import os
 from pathlib import Path
 from typing import Optional
-import re
 
 from fastmcp import FastMCP
 
-from overleaf_git import clone_overleaf_repo, run, get_git_email
+from overleaf_git import (
+    clone_overleaf_repo,
+    run,
+    get_git_email,
+    get_default_branch,
+    get_head_sha,
+)
 from latex_utils import (
     normalize_latex_content,
     latex_preview,
-    extract_section_body,
+    extract_section_body_from_file,
     strip_latex_to_plain,
+    section_body_span,
+    split_sentences,
 )
 
 # MCP server instance
 mcp = FastMCP("overleaf-mcp")
 
 
+def _read_utf8(file_path: Path) -> str:
+    """
+    Read a file as one raw-bytes syscall and decode, skipping the
+    io.TextIOWrapper / universal-newline layer of Path.read_text.
+    """
+    with open(file_path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def _write_utf8(file_path: Path, text: str) -> None:
+    """Binary-mode counterpart of _read_utf8 for writes."""
+    with open(file_path, "wb") as f:
+        f.write(text.encode("utf-8"))
+
+
+def _scandir_files(root: Path) -> list[str]:
+    """
+    Enumerate files under root with an iterative os.scandir walk.
+
+    Unlike os.walk, DirEntry reuses the file type reported by the
+    directory entry itself (d_type on Linux/macOS), so no per-entry stat
+    syscalls are needed. Skips .git; symlinks are not followed.
+    """
+    file_paths: list[str] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name == ".git":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    file_paths.append(os.path.relpath(entry.path, root))
+    return file_paths
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_preview(file_path: str, raw: bool, sha: str) -> str:
+    """
+    Read + preview a file, memoized per (path, raw, HEAD sha).
+
+    The sha key makes invalidation automatic: a pull that changes content
+    changes HEAD, so stale entries simply stop being hit.
+    """
+    content = _read_utf8(Path(file_path))
+    if raw:
+        return content
+    return latex_preview(content)
+
+
 @mcp.tool
 def read_overleaf_file(
     path: str = "main.tex",
@@ -43,12 +102,7 @@ def read_overleaf_file(
     if not file_path.exists():
         return f"File '{path}' does not exist in the Overleaf project."
 
-    content = file_path.read_text(encoding="utf-8")
-
-    if raw:
-        return content
-
-    return latex_preview(content)
+    return _cached_preview(str(file_path), raw, get_head_sha(repo_dir))
 
 
 @mcp.tool
@@ -63,19 +117,14 @@ def list_overleaf_files() -> list[str]:
     except Exception as e:
         return [f"Git clone failed: {e}"]
 
-    file_paths: list[str] = []
-
-    for root, dirs, files in os.walk(repo_dir):
-        # Skip .git
-        if ".git" in dirs:
-            dirs.remove(".git")
-
-        for file in files:
-            full_path = Path(root) / file
-            rel_path = full_path.relative_to(repo_dir)
-            file_paths.append(str(rel_path))
-
-    return file_paths
+    # git ls-files reads the index in one process: no per-directory stat
+    # calls, no recursion, and .git is excluded automatically.
+    try:
+        result = run(["git", "ls-files"], cwd=repo_dir)
+        return result.stdout.splitlines()
+    except RuntimeError:
+        # Index unreadable for some reason: fall back to walking the tree.
+        return _scandir_files(repo_dir)
 
 
 @mcp.tool
@@ -113,7 +162,8 @@ def update_overleaf_section(
         Optional git commit message.
     """
     try:
-        repo_dir = clone_overleaf_repo()
+        # Full history: some remotes reject pushes from a shallow clone.
+        repo_dir = clone_overleaf_repo(full_history=True)
     except Exception as e:
         return f"Git clone failed:\n{e}"
 
@@ -121,65 +171,55 @@ def update_overleaf_section(
     if not file_path.exists():
         return f"File '{path}' does not exist in the Overleaf project."
 
-    text = file_path.read_text(encoding="utf-8")
-
-    heading_cmd_escaped = re.escape(heading_command)
-    title_escaped = re.escape(section_title)
+    text = _read_utf8(file_path)
 
-    # Match:
+    # Locate:
     #   \sect{TITLE}<whitespace>BODY_UP_TO_NEXT_SECTION_OR_END
     # or
     #   \section{TITLE}...
-    pattern = (
-        rf"(\\{heading_cmd_escaped}\*?\{{{title_escaped}\}}\s*)"  # group 1: header
-        rf"(.*?)"                                                # group 2: body
-        rf"(?=("                                                 # lookahead: stop before next header/end
-        rf"\\{heading_cmd_escaped}\b|"
-        rf"\\section\b|"
-        rf"\\subsection\b|"
-        rf"\\chapter\b|"
-        rf"\\cvsection\b|"
-        rf"\\end\{{document\}}"
-        rf"))"
-    )
-    regex = re.compile(pattern, re.DOTALL)
-
-    # Normalize new section body before inserting (fix \n issues)
-    new_section_body = normalize_latex_content(new_section_body)
+    span = section_body_span(text, section_title, heading_command)
 
-    def replacer(match: re.Match) -> str:
-        header = match.group(1)
-        body = new_section_body.strip() + "\n"
-        return header + body
-
-    new_text, count = regex.subn(replacer, text, count=1)
-
-    if count == 0:
+    if span is None:
         return (
             f"Section '{section_title}' with heading '\\{heading_command}' "
             f"not found in '{path}'. No changes made."
         )
 
-    file_path.write_text(new_text, encoding="utf-8")
+    # Normalize new section body before inserting (fix \n issues)
+    new_section_body = normalize_latex_content(new_section_body)
+
+    body_start, body_end = span
+    new_text = text[:body_start] + new_section_body.strip() + "\n" + text[body_end:]
 
-    email = get_git_email()
-    run(["git", "config", "user.name", "Overleaf MCP Bot"], cwd=repo_dir)
-    run(["git", "config", "user.email", email], cwd=repo_dir)
+    if new_text == text:
+        return "No changes to commit after section replacement."
 
-    run(["git", "add", path], cwd=repo_dir)
+    _write_utf8(file_path, new_text)
+
+    email = get_git_email()
 
     if commit_message is None:
         commit_message = f"Update section '{section_title}' in {path}"
 
-    try:
-        run(["git", "commit", "-m", commit_message], cwd=repo_dir)
-    except RuntimeError:
-        return "No changes to commit after section replacement."
-
-    try:
-        run(["git", "push", "origin", "main"], cwd=repo_dir)
-    except RuntimeError:
-        run(["git", "push", "origin", "master"], cwd=repo_dir)
+    # One shell invocation instead of five subprocess spawns. User identity
+    # goes in as -c overrides so no git-config writes are needed; user input
+    # is passed as positional arguments, never interpolated into the script.
+    run(
+        [
+            "bash",
+            "-c",
+            'git add -- "$1" && '
+            'git -c user.name="Overleaf MCP Bot" -c user.email="$2" '
+            'commit -m "$3" && '
+            'git push origin "$4"',
+            "git-update",
+            path,
+            email,
+            commit_message,
+            get_default_branch(),
+        ],
+        cwd=repo_dir,
+    )
 
     return (
         f"Successfully updated section '{section_title}' in '{path}' "
@@ -211,8 +251,7 @@ def summarize_overleaf_section(
     if not file_path.exists():
         return f"File '{path}' does not exist in the Overleaf project."
 
-    full_text = file_path.read_text(encoding="utf-8")
-    body = extract_section_body(full_text, section_title, heading_command)
+    body = extract_section_body_from_file(file_path, section_title, heading_command)
 
     if body is None:
         return (
@@ -225,8 +264,11 @@ def summarize_overleaf_section(
     if not plain:
         return f"Section '{section_title}' is empty or could not be parsed."
 
-    # Very simple sentence splitting
-    sentences = re.split(r"(?<=[.!?])\s+", plain)
+    # Very simple sentence splitting. maxsplit stops the regex after the
+    # sentences we actually need instead of materializing them all; one
+    # extra split keeps the example fallback a single sentence rather than
+    # the unsplit remainder.
+    sentences = split_sentences(plain, maxsplit=max_sentences + 1)
     sentences = [s.strip() for s in sentences if s.strip()]
 
     if not sentences:
@@ -235,15 +277,14 @@ def summarize_overleaf_section(
     summary_sentences = sentences[:max_sentences]
     summary = " ".join(summary_sentences)
 
-    # Try to pick one concrete example line:
-    lines = [l.strip() for l in plain.splitlines() if l.strip()]
-    bullet_lines = [l for l in lines if l.startswith("- ")]
-    if bullet_lines:
-        example = bullet_lines[0]
-    elif len(sentences) > 1:
-        example = sentences[1]
-    else:
-        example = sentences[0]
+    # Try to pick one concrete example line: first bullet if any,
+    # found lazily so we stop at the first hit.
+    example = next(
+        (l.strip() for l in plain.splitlines() if l.strip().startswith("- ")),
+        None,
+    )
+    if example is None:
+        example = sentences[1] if len(sentences) > 1 else sentences[0]
 
     result_parts = [
         f"Summary of '{section_title}':",
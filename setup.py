@@ -0,0 +1,24 @@
+"""
+Build script for the optional latex_strip C extension.
+
+The extension accelerates strip_latex_to_plain on multi-hundred-KB LaTeX
+sources; latex_utils falls back to the pure-Python scanner when it has
+not been built, so this step is never required.
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("latex_strip.pyx")
+
+setup(
+    name="overleaf-mcp-latex-strip",
+    ext_modules=ext_modules,
+)